@@ -1,61 +1,66 @@
 from dotenv import load_dotenv
 import anthropic
+import httpx
 import os
 from server import tools, execute_tool
 
 load_dotenv()
-client = anthropic.Anthropic(api_key=os.getenv("API_KEY"))
+# HTTP/2 + keep-alive so repeated calls in the tool loop reuse one connection
+client = anthropic.Anthropic(
+    api_key=os.getenv("API_KEY"),
+    http_client=httpx.Client(
+        http2=True, limits=httpx.Limits(max_keepalive_connections=4)
+    ),
+)
 
+# Mark the tool block for Anthropic prompt caching; the schemas are identical
+# on every call so follow-up requests hit the server-side cache
+cached_tools = [
+    {**tool, "cache_control": {"type": "ephemeral"}} if i == len(tools) - 1 else tool
+    for i, tool in enumerate(tools)
+]
 
-def process_query(query):
-    messages = [{"role": "user", "content": query}]
-    response = client.messages.create(
+
+def stream_response(messages):
+    with client.messages.stream(
         max_tokens=2024,
         model="claude-3-7-sonnet-20250219",
-        tools=tools,
+        tools=cached_tools,
         messages=messages,
-    )
-    process_query = True
-    while process_query:
-        assistant_content = []
+    ) as stream:
+        for event in stream:
+            if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                print(event.delta.text, end="", flush=True)
+        print()
+        return stream.get_final_message()
 
-        for content in response.content:
-            if content.type == "text":
-                print(content.text)
-                assistant_content.append(content)
 
-            elif content.type == "tool_use":
-                assistant_content.append(content)
-                messages.append({"role": "assistant", "content": assistant_content})
+def process_query(query):
+    messages = [{"role": "user", "content": query}]
+    while True:
+        response = stream_response(messages)
 
-                tool_id = content.id
-                tool_args = content.input
-                tool_name = content.name
-                print(f"calling {tool_name} with {tool_args}")
+        tool_results = []
+        for content in response.content:
+            if content.type == "tool_use":
+                print(f"calling {content.name} with {content.input}")
 
-                result = execute_tool(tool_name=tool_name, tool_args=tool_args)
-                messages.append(
+                result = execute_tool(tool_name=content.name, tool_args=content.input)
+                tool_results.append(
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": tool_id,
-                                "content": result,
-                            }
-                        ],
+                        "type": "tool_result",
+                        "tool_use_id": content.id,
+                        "content": result,
                     }
                 )
-                response = client.messages.create(
-                    max_tokens=2024,
-                    model="claude-3-7-sonnet-20250219",
-                    tools=tools,
-                    messages=messages,
-                )
 
-                if len(response.content) == 1 and response.content[0].type == "text":
-                    print(response.content[0].text)
-                    process_query = False
+        if not tool_results:
+            break
+
+        # One assistant turn per response (the content list used as-is) and
+        # one user turn carrying all tool results
+        messages.append({"role": "assistant", "content": list(response.content)})
+        messages.append({"role": "user", "content": tool_results})
 
 
 def chat_loop():
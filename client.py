@@ -19,10 +19,12 @@ Requirements:
 """
 
 from contextlib import AsyncExitStack
+import functools
 import json
-from typing import Dict, List, TypedDict
+from typing import Any, Dict, List, TypedDict
 from dotenv import load_dotenv
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+import httpx
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 import nest_asyncio
@@ -47,6 +49,27 @@ class ToolDefinition(TypedDict):
     input_schema: dict
 
 
+@functools.lru_cache(maxsize=256)
+def _normalize_schema(schema_json: str) -> dict:
+    """Parse and sanitize a tool input schema, memoized by content.
+
+    Strips JSON Schema metadata keys that Anthropic's tool-use API does
+    not use. The cache is keyed on the serialized schema, so identical
+    schemas — common when the same server type is connected more than
+    once — are parsed and sanitized a single time and the resulting dict
+    is shared.
+
+    Args:
+        schema_json: The schema serialized with sorted keys
+
+    Returns:
+        The sanitized schema dict
+    """
+    schema = json.loads(schema_json)
+    schema.pop("$schema", None)
+    return schema
+
+
 class MCP_ChatBot:
     """A chatbot that integrates with MCP servers and the Anthropic Claude API.
     
@@ -56,64 +79,91 @@ class MCP_ChatBot:
     
     Attributes:
         sessions: List of active MCP server sessions
-        exit_stack: AsyncExitStack for managing async context managers
         anthropic: Anthropic API client instance
         available_tools: List of all available tools across all connected servers
-        tool_to_session: Mapping of tool names to their respective server sessions
+        cached_tools: available_tools with a prompt-cache marker on the last entry
+        tool_to_call: Mapping of tool names to the bound call_tool method of
+            the session that provides them
     """
 
     def __init__(self):
         """Initialize the chatbot with empty sessions and tool registries."""
         self.sessions: List[ClientSession] = []
-        self.exit_stack = AsyncExitStack()
-        self.anthropic = Anthropic(api_key=os.getenv("API_KEY"))
+        self._server_tasks: List[asyncio.Task] = []
+        self._shutdown = asyncio.Event()
+        self.anthropic = AsyncAnthropic(
+            api_key=os.getenv("API_KEY"),
+            # HTTP/2 + keep-alive so the tool loop's repeated calls reuse
+            # one connection instead of paying a TLS handshake per turn
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            ),
+        )
         self.available_tools: List[ToolDefinition] = []
-        self.tool_to_session: Dict[str, ClientSession] = {}
+        self.cached_tools: List[dict] = []
+        self.tool_to_call: Dict[str, Any] = {}
+
+    async def connect_to_server(
+        self, server_name: str, server_config: dict, ready: asyncio.Event
+    ) -> None:
+        """Connect to a single MCP server, register its tools and serve it.
+
+        Runs as a long-lived task per server: the stdio transport and
+        session contexts are entered and exited in this same task, which
+        anyio's cancel scopes require, then the connection is held open
+        until cleanup() signals shutdown.
 
-    async def connect_to_server(self, server_name: str, server_config: dict) -> None:
-        """Connect to a single MCP server and register its tools.
-        
         Args:
             server_name: Name identifier for the server
             server_config: Configuration dictionary for the server connection
-        
-        Raises:
-            Exception: If connection fails or tool registration encounters an error
+            ready: Event set once the server's tools are registered (or the
+                connection has failed)
         """
         try:
-            server_params = StdioServerParameters(**server_config)
-            stdio_transport = await self.exit_stack.enter_async_context(
-                stdio_client(server_params)
-            )
-            read, write = stdio_transport
-            session = await self.exit_stack.enter_async_context(
-                ClientSession(read, write)
-            )
-            await session.initialize()
-            self.sessions.append(session)
-
-            response = await session.list_tools()
-            tools = response.tools
-            print(f"\nConnected to {server_name} with tools: {[t.name for t in tools]}")
-
-            for tool in tools:
-                self.tool_to_session[tool.name] = session
-                self.available_tools.append(
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "input_schema": tool.inputSchema,
-                    }
+            async with AsyncExitStack() as stack:
+                server_params = StdioServerParameters(**server_config)
+                stdio_transport = await stack.enter_async_context(
+                    stdio_client(server_params)
                 )
+                read, write = stdio_transport
+                session = await stack.enter_async_context(
+                    ClientSession(read, write)
+                )
+                await session.initialize()
+                self.sessions.append(session)
+
+                response = await session.list_tools()
+                tools = response.tools
+                print(f"\nConnected to {server_name} with tools: {[t.name for t in tools]}")
+
+                for tool in tools:
+                    # Store the bound method so dispatch is a single dict lookup
+                    self.tool_to_call[tool.name] = session.call_tool
+                    self.available_tools.append(
+                        {
+                            "name": tool.name,
+                            "description": tool.description,
+                            "input_schema": _normalize_schema(
+                                json.dumps(tool.inputSchema, sort_keys=True)
+                            ),
+                        }
+                    )
+                ready.set()
+                await self._shutdown.wait()
         except Exception as e:
             print(f"Failed to connect to {server_name}:  {e}")
+        finally:
+            ready.set()
 
     async def connect_to_servers(self) -> None:
         """Connect to all MCP Servers defined in server_config.json.
         
         The configuration file should define a dictionary of server configurations
-        under the 'mcpServers' key.
-        
+        under the 'mcpServers' key. All servers are connected concurrently,
+        so cold start takes as long as the slowest server rather than the
+        sum of them.
+
         Raises:
             Exception: If the config file cannot be read or if connection fails
         """
@@ -123,87 +173,127 @@ class MCP_ChatBot:
 
             servers = data.get("mcpServers", {})
 
+            # Process spawn + initialize + list_tools is latency-bound per
+            # server, so run the connections in parallel, each as its own
+            # long-lived task. Registry updates happen between awaits on a
+            # single event loop, so no lock is needed.
+            ready_events = []
             for server_name, server_config in servers.items():
-                await self.connect_to_server(server_name, server_config)
+                ready = asyncio.Event()
+                self._server_tasks.append(
+                    asyncio.create_task(
+                        self.connect_to_server(server_name, server_config, ready)
+                    )
+                )
+                ready_events.append(ready)
+
+            # Wait until every server has registered its tools (or failed)
+            await asyncio.gather(*(ready.wait() for ready in ready_events))
+
+            # Mark the tool block for Anthropic prompt caching: the schema
+            # list is identical on every call in the tool loop, so follow-up
+            # requests hit the server-side cache instead of re-tokenizing it
+            self.cached_tools = [
+                {**tool, "cache_control": {"type": "ephemeral"}}
+                if i == len(self.available_tools) - 1
+                else tool
+                for i, tool in enumerate(self.available_tools)
+            ]
         except Exception as e:
             print(f"Error loading server config: {e}")
             raise e
 
+    async def _stream_response(self, messages: List[dict]):
+        """Stream a Claude response, printing text deltas as they arrive.
+
+        Streaming shows the first token as soon as it is generated instead of
+        waiting for the full message, and lets tool calls be dispatched as soon
+        as the response is complete.
+
+        Args:
+            messages: The conversation history to send to Claude
+
+        Returns:
+            The fully assembled final message from the stream
+        """
+        async with self.anthropic.messages.stream(
+            max_tokens=2024,
+            model="claude-3-7-sonnet-20250219",
+            tools=self.cached_tools,
+            messages=messages,
+        ) as stream:
+            async for event in stream:
+                if (
+                    event.type == "content_block_delta"
+                    and event.delta.type == "text_delta"
+                ):
+                    print(event.delta.text, end="", flush=True)
+            print()
+            return await stream.get_final_message()
+
     async def process_query(self, query: str) -> None:
         """Process a user query using Claude and handle any tool calls.
-        
+
         This method sends the query to Claude, interprets the response,
         executes any requested tool calls, and manages the conversation flow
-        until a final response is reached.
-        
+        until a final response is reached. All tool calls in a single
+        response are run concurrently since Claude frequently requests
+        several independent tools in one turn; running them in parallel
+        keeps one slow tool from serializing the rest.
+
         Args:
             query: The user's input query string
         """
         messages = [{"role": "user", "content": query}]
-        response = self.anthropic.messages.create(
-            max_tokens=2024,
-            model="claude-3-7-sonnet-20250219",
-            tools=self.available_tools,
-            messages=messages,
-        )
 
-        process_query = True
-        while process_query:
-            assistant_content = []
-            for content in response.content:
-                if content.type == "text":
-                    print(content.text)
-                    assistant_content.append(content)
-                    if len(response.content) == 1:
-                        process_query = False
-                elif content.type == "tool_use":
-                    assistant_content.append(content)
-                    messages.append({"role": "assistant", "content": assistant_content})
-                    tool_id = content.id
-                    tool_args = content.input
-                    tool_name = content.name
-
-                    print(f"Calling tool {tool_name} with {tool_args}")
-                    session = self.tool_to_session[tool_name]
-                    result = await session.call_tool(tool_name, tool_args)
-                    messages.append(
+        while True:
+            response = await self._stream_response(messages)
+
+            tool_calls = [
+                content for content in response.content if content.type == "tool_use"
+            ]
+            if not tool_calls:
+                break
+
+            messages.append({"role": "assistant", "content": list(response.content)})
+
+            for call in tool_calls:
+                print(f"Calling tool {call.name} with {call.input}")
+            results = await asyncio.gather(
+                *(
+                    self.tool_to_call[call.name](call.name, call.input)
+                    for call in tool_calls
+                )
+            )
+            messages.append(
+                {
+                    "role": "user",
+                    "content": [
                         {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": tool_id,
-                                    "content": result.content,
-                                }
-                            ],
+                            "type": "tool_result",
+                            "tool_use_id": call.id,
+                            "content": result.content,
                         }
-                    )
-                    response = self.anthropic.messages.create(
-                        max_tokens=2024,
-                        model="claude-3-7-sonnet-20250219",
-                        tools=self.available_tools,
-                        messages=messages,
-                    )
-                    if (
-                        len(response.content) == 1
-                        and response.content[0].type == "text"
-                    ):
-                        print(response.content[0].text)
-                        process_query = False
+                        for call, result in zip(tool_calls, results)
+                    ],
+                }
+            )
 
     async def chat_loop(self) -> None:
         """Run the main interactive chat loop.
         
         Continuously prompts for user input and processes queries until
         the user types 'quit'. Handles errors gracefully and displays
-        them to the user.
+        them to the user. The prompt runs in a worker thread so the
+        event loop (MCP sessions, in-flight streams) stays responsive
+        while waiting for input.
         """
         print("\nMCP Chatbot Started")
         print("Enter queries or type 'quit' to exit")
 
         while True:
             try:
-                query = input("\nQuery: ").strip()
+                query = (await asyncio.to_thread(input, "\nQuery: ")).strip()
                 if query.lower() == "quit":
                     break
 
@@ -214,11 +304,14 @@ class MCP_ChatBot:
 
     async def cleanup(self) -> None:
         """Clean up resources by closing all MCP server connections.
-        
-        Should be called when shutting down the chatbot to ensure proper
-        cleanup of resources and connections.
+
+        Signals the per-server tasks to exit; each task closes its own
+        transport and session contexts in the task that entered them,
+        as anyio's cancel scopes require.
         """
-        await self.exit_stack.aclose()
+        self._shutdown.set()
+        if self._server_tasks:
+            await asyncio.gather(*self._server_tasks, return_exceptions=True)
 
 
 async def main() -> None:
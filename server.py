@@ -21,20 +21,31 @@ Features:
     - Research summary generation
 
 Dependencies:
-    - arxiv: For accessing the arXiv API
+    - aiofiles: For async metadata file I/O
+    - httpx: For async access to the arXiv API with connection pooling
+    - feedparser: For parsing arXiv's Atom responses
     - mcp.server.fastmcp: For MCP server implementation
-    - json: For metadata storage
+    - orjson: For fast metadata (de)serialization
     - os: For file system operations
 
 Directory Structure:
     papers/
         topic_name/
-            papers_info.json
+            papers_info.json   (compacted store)
+            papers_info.jsonl  (append-only sidecar of recent records)
 """
 
-import arxiv
-import json
+import aiofiles
+import asyncio
+import fastjsonschema
+import feedparser
+import functools
+import httpx
+import inspect
+import orjson
 import os
+import sqlite3
+import threading
 from typing import List, Dict, Any
 from mcp.server.fastmcp import FastMCP
 
@@ -44,27 +55,170 @@ mcp = FastMCP("research")
 
 PAPER_DIR = "papers"
 
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+
+# Shared async HTTP client so repeated searches reuse pooled connections
+# instead of paying TCP/TLS setup on every query
+_http = httpx.AsyncClient(
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=8),
+)
+
+PAPERS_DB = "papers.db"
+
+# Persistent point-lookup store for paper metadata. Unlike the per-topic
+# JSON files (which remain the interchange format for the MCP resources),
+# the database answers extract_info queries in O(log N) without parsing
+# any topic file. FastMCP runs sync handlers in worker threads, hence
+# check_same_thread=False plus a lock around statements.
+_db = sqlite3.connect(PAPERS_DB, check_same_thread=False)
+_db.execute(
+    """CREATE TABLE IF NOT EXISTS papers(
+        id TEXT PRIMARY KEY,
+        topic TEXT NOT NULL,
+        title TEXT,
+        authors_json TEXT,
+        summary TEXT,
+        pdf_url TEXT,
+        published TEXT
+    )"""
+)
+_db.execute("CREATE INDEX IF NOT EXISTS idx_topic ON papers(topic)")
+_db.commit()
+_db_lock = threading.Lock()
+
+# In-memory caches for paper metadata. Each topic's on-disk state is
+# parsed once and reused until the file mtimes change, and the paper
+# index lets extract_info jump straight to the right topic instead of
+# re-reading every file on every lookup.
+_topic_cache: Dict[str, tuple] = {}  # topic slug -> (mtime key, papers_info dict)
+_paper_index: Dict[str, str] = {}  # paper_id -> topic slug
+_sidecar_lines: Dict[str, int] = {}  # topic slug -> line count in the jsonl sidecar
+
+# Guards the one-time full build of _paper_index; FastMCP runs sync
+# handlers in worker threads, so first use may race
+_index_lock = threading.Lock()
+_index_complete = False
+
+
+def _ensure_index() -> None:
+    """
+    Build the complete paper_id -> topic index on first use.
 
-@mcp.resource("papers://folders")
-def get_available_folders() -> str:
+    Walks every topic directory exactly once so subsequent extract_info
+    calls are O(1) dict lookups; papers added later by search_papers are
+    indexed incrementally as they are written.
     """
-    List all available research topic folders and format them as a markdown list.
-    
+    global _index_complete
+    if _index_complete:
+        return
+    with _index_lock:
+        if _index_complete:
+            return
+        if os.path.exists(PAPER_DIR):
+            with os.scandir(PAPER_DIR) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        _load_topic(entry.name)
+        _index_complete = True
+
+
+def _topic_mtimes(topic_dir: str) -> tuple:
+    """
+    Return the mtimes of a topic's papers_info.json and papers_info.jsonl.
+
+    Args:
+        topic_dir: The slugified topic directory name
+
     Returns:
-        str: Markdown-formatted string containing:
-            - List of available research topics
-            - Instructions for accessing papers in a topic
-            - Message if no topics are available
+        tuple: (json mtime, jsonl mtime), with None for a missing file
+    """
+    mtimes = []
+    for name in ("papers_info.json", "papers_info.jsonl"):
+        try:
+            mtimes.append(os.path.getmtime(f"{PAPER_DIR}/{topic_dir}/{name}"))
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _load_topic(topic_dir: str) -> Dict[str, Any] | None:
     """
-    folders = []
+    Load the papers_info dict for a topic directory, using the cache.
 
-    if os.path.exists(PAPER_DIR):
-        for topic_dir in os.listdir(PAPER_DIR):
-            topic_path = os.path.join(PAPER_DIR, topic_dir)
-            if os.path.isdir(topic_path):
-                papers_file = os.path.join(topic_path, 'papers_info.json')
-                if os.path.exists(papers_file):
-                    folders.append(topic_dir)
+    The topic's state is the compacted papers_info.json overlaid with any
+    records appended to the papers_info.jsonl sidecar since the last
+    compaction (later lines supersede earlier ones). The merged dict is
+    cached and validated against both file mtimes, so external edits are
+    picked up while repeated reads stay in-memory.
+
+    Args:
+        topic_dir: The slugified topic directory name (e.g. "machine_learning")
+
+    Returns:
+        The papers_info dict for the topic, or None if no data exists or
+        the compacted file cannot be parsed
+    """
+    mtime_key = _topic_mtimes(topic_dir)
+    if mtime_key == (None, None):
+        _topic_cache.pop(topic_dir, None)
+        return None
+
+    cached = _topic_cache.get(topic_dir)
+    if cached is not None and cached[0] == mtime_key:
+        return cached[1]
+
+    papers_info: Dict[str, Any] = {}
+    if mtime_key[0] is not None:
+        papers_file = f"{PAPER_DIR}/{topic_dir}/papers_info.json"
+        try:
+            with open(papers_file, "rb") as json_file:
+                papers_info = orjson.loads(json_file.read())
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
+            print(f"Error reading {papers_file}: {str(e)}")
+            return None
+
+    lines = 0
+    if mtime_key[1] is not None:
+        sidecar_file = f"{PAPER_DIR}/{topic_dir}/papers_info.jsonl"
+        try:
+            with open(sidecar_file, "rb") as jsonl_file:
+                for line in jsonl_file:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = orjson.loads(line)
+                    papers_info[record.pop("id")] = record
+                    lines += 1
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
+            print(f"Error reading {sidecar_file}: {str(e)}")
+
+    _sidecar_lines[topic_dir] = lines
+    _topic_cache[topic_dir] = (mtime_key, papers_info)
+    for paper_id in papers_info:
+        _paper_index[paper_id] = topic_dir
+    return papers_info
+
+
+@functools.lru_cache(maxsize=128)
+def _render_folders(topics_key: tuple) -> str:
+    """
+    Render the markdown topic listing, memoized on per-topic file mtimes.
+
+    The key carries each topic directory's (name, metadata-file mtimes),
+    so any write or deletion inside a topic produces a fresh cache entry
+    while repeated requests against unchanged data reuse the
+    already-formatted string.
+
+    Args:
+        topics_key: Sorted tuple of (topic name, _topic_mtimes(name))
+            pairs for every topic directory
+
+    Returns:
+        str: Markdown-formatted list of available topics
+    """
+    folders = [name for name, mtimes in topics_key if mtimes != (None, None)]
 
     content = "# Available Topics\n\n"
     if folders:
@@ -73,17 +227,94 @@ def get_available_folders() -> str:
         content += f"\nUse @{folders[0]} to access papers in that topic.\n"
     else:
         content += "No research topics available yet."
-    
+
+    return content
+
+
+@mcp.resource("papers://folders")
+def get_available_folders() -> str:
+    """
+    List all available research topic folders and format them as a markdown list.
+
+    Returns:
+        str: Markdown-formatted string containing:
+            - List of available research topics
+            - Instructions for accessing papers in a topic
+            - Message if no topics are available
+    """
+    if not os.path.exists(PAPER_DIR):
+        return "# Available Topics\n\nNo research topics available yet."
+
+    # scandir's DirEntry carries the dir/file type from the directory
+    # listing itself, avoiding a separate stat per entry. Sorted for a
+    # stable cache key regardless of listing order.
+    with os.scandir(PAPER_DIR) as entries:
+        topics_key = tuple(
+            sorted(
+                (entry.name, _topic_mtimes(entry.name))
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            )
+        )
+
+    return _render_folders(topics_key)
+
+PAPER_TEMPLATE = """
+## {title}
+- **Paper ID**: {id}
+- **Authors**: {authors}
+- **Publiished**: {published}
+- **PDF URL**: {pdf_url}
+### Summary
+{summary}
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _render_topic(topic: str, mtime_key: tuple) -> str:
+    """
+    Render the markdown paper listing for a topic, memoized on the
+    mtimes of the topic's metadata files.
+
+    A new mtime naturally yields a fresh cache entry and stale entries
+    are LRU-evicted, so repeated reads of an unchanged topic skip both
+    the JSON parse and the string formatting.
+
+    Args:
+        topic: The research topic to render papers for
+        mtime_key: The current (json, jsonl) mtimes for the topic
+
+    Returns:
+        str: Markdown-formatted paper listing for the topic
+    """
+    topic_dir = topic.lower().replace(" ", "_")
+    papers_data = _load_topic(topic_dir)
+    if papers_data is None:
+        return f"# Error reading papers data for {topic}\n\n.The file is corrupted"
+
+    content = f"# Papers on {topic.replace('_', " ")}\n\nTotal papers: {len(papers_data)}\n\n"
+
+    for paper_id, paper_info, in papers_data.items():
+        content += PAPER_TEMPLATE.format(
+            title=paper_info.get('title', ''),
+            id=paper_id,
+            authors=', '.join(paper_info.get('authors',[])),
+            published=paper_info.get('published', ''),
+            pdf_url=paper_info.get('pdf_url', ''),
+            summary=paper_info.get('summary', '')
+        )
+        content += '\n\n'
     return content
 
+
 @mcp.resource("papers://{topic}")
 def get_topic_papers(topic: str) -> str:
     """
     Retrieve and format information about all papers in a specific topic.
-    
+
     Args:
         topic: The research topic to retrieve papers for
-        
+
     Returns:
         str: Markdown-formatted string containing:
             - Topic title
@@ -95,43 +326,17 @@ def get_topic_papers(topic: str) -> str:
                 - Publication date
                 - PDF URL
                 - Summary
-                
+
     Note:
         Papers are stored in topic-specific directories with metadata in papers_info.json
     """
-    PAPER_TEMPLATE="""
-## {title}
-- **Paper ID**: {id}
-- **Authors**: {authors}
-- **Publiished**: {published}
-- **PDF URL**: {pdf_url}
-### Summary
-{summary}
-"""
     topic_dir = topic.lower().replace(" ", "_")
-    papers_file = os.path.join(PAPER_DIR, topic_dir, "papers_info.json")
+    mtime_key = _topic_mtimes(topic_dir)
 
-    if not os.path.exists(papers_file):
+    if mtime_key == (None, None):
         return f"# No papers found for topic: {topic}\nTry searching for papers on this topic"
-    try:
-        with open(papers_file, 'r') as f:
-            papers_data = json.load(f)
-        content = f"# Papers on {topic.replace('_', " ")}\n\nTotal papers: {len(papers_data)}\n\n"
-
-        for paper_id, paper_info, in papers_data.items():
-            content += PAPER_TEMPLATE.format(
-                title=paper_info.get('title', ''),
-                id=paper_id,
-                authors=', '.join(paper_info.get('authors',[])),
-                published=paper_info.get('published', ''),
-                pdf_url=paper_info.get('pdf_url', ''),
-                summary=paper_info.get('summary', '')
-            )
-            content += '\n\n'
-        return content
-    except json.JSONDecodeError:
-        return f"# Error reading papers data for {topic}\n\n.The file is corrupted"
-    
+
+    return _render_topic(topic, mtime_key)
 
 @mcp.prompt()
 def generate_search_prompt(topic: str, num_papers: int = 5) -> str:
@@ -178,23 +383,26 @@ def generate_search_prompt(topic: str, num_papers: int = 5) -> str:
 
 
 @mcp.tool()
-def search_papers(topic: str, max_results: int = 5) -> List[str]:
+async def search_papers(topic: str, max_results: int = 5) -> List[str]:
     """
     Search for papers on arXiv based on a topic and store their information.
-    
+
     This function searches arXiv for papers matching the given topic, downloads
     their metadata, and stores it in a topic-specific JSON file. It creates
-    the necessary directory structure if it doesn't exist.
-    
+    the necessary directory structure if it doesn't exist. The search runs
+    through a shared async HTTP client so the request doesn't block the MCP
+    event loop and repeated searches reuse pooled connections.
+
     Args:
         topic: The topic to search for papers about
         max_results: Maximum number of papers to retrieve (default: 5)
-        
+
     Returns:
         List[str]: List of arXiv paper IDs found in the search
-        
+
     Note:
-        Papers are stored in: papers/<topic>/papers_info.json
+        New papers are appended to papers/<topic>/papers_info.jsonl and
+        periodically compacted into papers/<topic>/papers_info.json.
         Each paper's metadata includes:
             - Title
             - Authors
@@ -203,47 +411,103 @@ def search_papers(topic: str, max_results: int = 5) -> List[str]:
             - Publication date
     """
 
-    # Use arxiv to find the papers
-    client = arxiv.Client()
-
-    # Search for the most relevant articles matching the queried topic
-    search = arxiv.Search(
-        query=topic, max_results=max_results, sort_by=arxiv.SortCriterion.Relevance
+    # Query the arXiv Atom API for the most relevant articles on the topic
+    response = await _http.get(
+        ARXIV_API_URL,
+        params={
+            "search_query": f"all:{topic}",
+            "max_results": max_results,
+            "sortBy": "relevance",
+        },
     )
+    response.raise_for_status()
 
-    papers = client.results(search)
+    feed = feedparser.parse(response.content)
 
     # Create directory for this topic
-    path = os.path.join(PAPER_DIR, topic.lower().replace(" ", "_"))
+    topic_dir = topic.lower().replace(" ", "_")
+    path = f"{PAPER_DIR}/{topic_dir}"
     os.makedirs(path, exist_ok=True)
 
-    file_path = os.path.join(path, "papers_info.json")
+    file_path = f"{path}/papers_info.json"
+    sidecar_path = f"{path}/papers_info.jsonl"
 
-    # Try to load existing papers info
-    try:
-        with open(file_path, "r") as json_file:
-            papers_info = json.load(json_file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        papers_info = {}
+    # Merge with existing papers info (usually already cached in memory);
+    # a cache miss reads files synchronously, so keep it off the event loop
+    papers_info = dict(await asyncio.to_thread(_load_topic, topic_dir) or {})
 
     # Process each paper and add to papers_info
     paper_ids = []
-    for paper in papers:
-        paper_ids.append(paper.get_short_id())
+    new_records = []
+    db_rows = []
+    for entry in feed.entries:
+        # Entry IDs look like http://arxiv.org/abs/2301.00001v1
+        paper_id = entry.id.split("/abs/")[-1]
+        paper_ids.append(paper_id)
         paper_info = {
-            "title": paper.title,
-            "authors": [author.name for author in paper.authors],
-            "summary": paper.summary,
-            "pdf_url": paper.pdf_url,
-            "published": str(paper.published.date()),
+            "title": entry.title,
+            "authors": [author.name for author in entry.authors],
+            "summary": entry.summary,
+            "pdf_url": next(
+                (
+                    link.href
+                    for link in entry.links
+                    if link.get("type") == "application/pdf"
+                ),
+                None,
+            ),
+            "published": entry.published[:10],
         }
-        papers_info[paper.get_short_id()] = paper_info
+        papers_info[paper_id] = paper_info
+        new_records.append(orjson.dumps({"id": paper_id, **paper_info}))
+        db_rows.append(
+            (
+                paper_id,
+                topic_dir,
+                paper_info["title"],
+                orjson.dumps(paper_info["authors"]).decode(),
+                paper_info["summary"],
+                paper_info["pdf_url"],
+                paper_info["published"],
+            )
+        )
+
+    # Append only the new records to the jsonl sidecar — O(new) per call
+    # instead of rewriting the whole topic dict
+    if new_records:
+        async with aiofiles.open(sidecar_path, "ab") as jsonl_file:
+            await jsonl_file.write(b"\n".join(new_records) + b"\n")
+
+    lines = _sidecar_lines.get(topic_dir, 0) + len(new_records)
+
+    # Compact once superseded sidecar lines outnumber live entries: rewrite
+    # the full papers_info.json and truncate the sidecar
+    if lines > 2 * len(papers_info):
+        async with aiofiles.open(file_path, "wb") as json_file:
+            await json_file.write(
+                orjson.dumps(papers_info, option=orjson.OPT_INDENT_2)
+            )
+        try:
+            os.remove(sidecar_path)
+        except OSError:
+            pass
+        lines = 0
+
+    # Upsert the new papers into the persistent store in one transaction
+    if db_rows:
+        with _db_lock, _db:
+            _db.executemany(
+                "INSERT OR REPLACE INTO papers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                db_rows,
+            )
 
-    # Save updated papers_info to json file
-    with open(file_path, "w") as json_file:
-        json.dump(papers_info, json_file, indent=2)
+    # Keep the in-memory caches consistent with what was just written
+    _sidecar_lines[topic_dir] = lines
+    _topic_cache[topic_dir] = (_topic_mtimes(topic_dir), papers_info)
+    for paper_id in paper_ids:
+        _paper_index[paper_id] = topic_dir
 
-    print(f"Results are saved in: {file_path}")
+    print(f"Results are saved in: {path}")
 
     return paper_ids
 
@@ -264,23 +528,54 @@ def extract_info(paper_id: str) -> str:
         
     Note:
         The function searches all topic directories as a paper might be
-        referenced in multiple research topics.
+        referenced in multiple research topics. Lookups are served from the
+        in-memory paper index or the persistent papers.db store when
+        possible, falling back to a directory scan for papers that haven't
+        been indexed yet.
     """
- 
-    for item in os.listdir(PAPER_DIR):
-        item_path = os.path.join(PAPER_DIR, item)
-        if os.path.isdir(item_path):
-            file_path = os.path.join(item_path, "papers_info.json")
-            if os.path.isfile(file_path):
-                try:
-                    with open(file_path, "r") as json_file:
-                        papers_info = json.load(json_file)
-                        if paper_id in papers_info:
-                            return json.dumps(papers_info[paper_id], indent=2)
-                except (FileNotFoundError, json.JSONDecodeError) as e:
-                    print(f"Error reading {file_path}: {str(e)}")
-                    continue
-    
+
+    # Fast path: the index already knows which topic holds this paper
+    topic_dir = _paper_index.get(paper_id)
+    if topic_dir is not None:
+        papers_info = _load_topic(topic_dir)
+        if papers_info is not None and paper_id in papers_info:
+            return orjson.dumps(papers_info[paper_id], option=orjson.OPT_INDENT_2).decode()
+
+    # Point lookup in the persistent store — O(log N) and no topic files
+    # need to be parsed, including for papers saved in previous runs
+    with _db_lock:
+        row = _db.execute(
+            "SELECT title, authors_json, summary, pdf_url, published"
+            " FROM papers WHERE id = ?",
+            (paper_id,),
+        ).fetchone()
+    if row is not None:
+        paper_info = {
+            "title": row[0],
+            "authors": orjson.loads(row[1]),
+            "summary": row[2],
+            "pdf_url": row[3],
+            "published": row[4],
+        }
+        return orjson.dumps(paper_info, option=orjson.OPT_INDENT_2).decode()
+
+    _ensure_index()
+
+    # The full index may know about papers that predate the database
+    topic_dir = _paper_index.get(paper_id)
+    if topic_dir is not None:
+        papers_info = _load_topic(topic_dir)
+        if papers_info is not None and paper_id in papers_info:
+            return orjson.dumps(papers_info[paper_id], option=orjson.OPT_INDENT_2).decode()
+
+    # Slow path: scan every topic directory, populating the caches as we go
+    with os.scandir(PAPER_DIR) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                papers_info = _load_topic(entry.name)
+                if papers_info is not None and paper_id in papers_info:
+                    return orjson.dumps(papers_info[paper_id], option=orjson.OPT_INDENT_2).decode()
+
     return f"There's no saved information related to paper {paper_id}."
 
 tools = [
@@ -324,6 +619,45 @@ mapping_tool_function = {
     "extract_info": extract_info
 }
 
+# Compile each tool's input schema once at import; the generated
+# validators are plain Python functions, far cheaper per call than
+# interpreting the schema on every dispatch
+_validators = {
+    tool["name"]: fastjsonschema.compile(tool["input_schema"]) for tool in tools
+}
+
+# Persistent background event loop for driving async tools from the
+# synchronous chatbot path. A per-call asyncio.run would close its loop
+# on return, orphaning the keep-alive connections the shared _http
+# client holds and breaking every search after the first.
+_tool_loop: asyncio.AbstractEventLoop | None = None
+_tool_loop_lock = threading.Lock()
+
+
+def _run_async(coro):
+    """
+    Run a coroutine to completion on the persistent background loop.
+
+    The loop is created lazily in a daemon thread on first use and then
+    reused for every call, so loop-bound resources like the shared HTTP
+    connection pool stay valid across tool invocations.
+
+    Args:
+        coro: The coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    global _tool_loop
+    with _tool_loop_lock:
+        if _tool_loop is None:
+            _tool_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_tool_loop.run_forever, name="tool-loop", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _tool_loop).result()
+
+
 def execute_tool(tool_name: str, tool_args: Dict[str, Any]) -> str:
     """
     Execute a tool by name with the provided arguments.
@@ -334,17 +668,28 @@ def execute_tool(tool_name: str, tool_args: Dict[str, Any]) -> str:
     Args:
         tool_name: Name of the tool to execute
         tool_args: Dictionary of arguments to pass to the tool
-        
+
     Returns:
-        str: Formatted result of the tool execution:
+        str: Formatted result of the tool execution, or an error message
+            if the arguments do not match the tool's input schema:
             - For None: Message indicating completion
             - For lists: Comma-separated string
             - For dicts: Formatted JSON string
             - For other types: String representation
     """
     
+    try:
+        _validators[tool_name](tool_args)
+    except fastjsonschema.JsonSchemaException as e:
+        return f"Invalid arguments for {tool_name}: {e.message}"
+
     result = mapping_tool_function[tool_name](**tool_args)
 
+    # Async tools (e.g. search_papers) return a coroutine when called from
+    # the synchronous chatbot path; drive it on the persistent loop
+    if inspect.iscoroutine(result):
+        result = _run_async(result)
+
     if result is None:
         result = "The operation completed but didn't return any results."
         
@@ -353,7 +698,7 @@ def execute_tool(tool_name: str, tool_args: Dict[str, Any]) -> str:
         
     elif isinstance(result, dict):
         # Convert dictionaries to formatted JSON strings
-        result = json.dumps(result, indent=2)
+        result = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
     
     else:
         # For any other type, convert using str()